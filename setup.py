@@ -17,16 +17,14 @@ setup(
     py_modules=['twisted_s3'],
     install_requires=[
         'fido >= 2.1.0',
-        'six',
+        # Without service_identity, twisted falls back to degraded
+        # certificate verification for the HTTPS connections we now make.
+        'service_identity',
+        'twisted >= 14.0.0',
     ],
+    python_requires='>=3.7',
     extras_require={
-        ':python_version!="2.6"': ['twisted >= 14.0.0'],
-        ':python_version=="2.6"': ['twisted >= 14.0.0, < 15.5'],
-    },
-    options={
-        'bdist_wheel': {
-            'universal': 1,
-        },
+        'lxml': ['lxml'],
     },
     version='0.2.2',
 )
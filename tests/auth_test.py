@@ -4,6 +4,9 @@ These examples from
 http://docs.aws.amazon.com/AmazonS3/latest/API/sig-v4-header-based-auth.html#example-signature-calculations
 """
 import datetime
+import hashlib
+import hmac
+import io
 
 import pytest
 import pytz
@@ -88,6 +91,11 @@ def secret_key():
     return "fakekeywg5QN60eASHGsL46obAsk2AK14ne0boea"
 
 
+@pytest.fixture
+def aws4_secret(secret_key):
+    return ("AWS4" + secret_key).encode("utf-8")
+
+
 @pytest.fixture
 def request_params(request_datetime):
     hashed_payload = auth.compute_hashed_payload(b"")
@@ -120,6 +128,32 @@ def canonical_request(request_params):
     return canonical_request
 
 
+def test_compute_hashed_payload_empty():
+    hashed = auth.compute_hashed_payload(b"")
+    assert hashed == auth.EMPTY_PAYLOAD_SHA256
+    assert hashed == hashlib.sha256(b"").hexdigest()
+
+
+def test_compute_hashed_payload_file():
+    payload = b"some bytes"
+    payload_file = io.BytesIO(payload)
+    hashed = auth.compute_hashed_payload(payload_file)
+    assert hashed == hashlib.sha256(payload).hexdigest()
+    # The file position is restored so the payload can still be read
+    assert payload_file.read() == payload
+
+
+def test_compute_hashed_payload_file_without_file_digest(monkeypatch):
+    # Interpreters older than 3.11 don't have hashlib.file_digest;
+    # the chunked-read fallback must produce the same digest.
+    monkeypatch.delattr("twisted_s3.auth.hashlib.file_digest")
+    payload = b"some bytes"
+    payload_file = io.BytesIO(payload)
+    hashed = auth.compute_hashed_payload(payload_file)
+    assert hashed == hashlib.sha256(payload).hexdigest()
+    assert payload_file.read() == payload
+
+
 def test_create_canonical_query_string_empty():
     query_string = auth.create_canonical_query_string({})
     assert query_string == ""
@@ -138,8 +172,21 @@ def test_create_canonical_query_string(expected_query_string):
     assert query_string == expected_query_string
 
 
+def test_create_canonical_query_string_pairs_value_error():
+    with pytest.raises(ValueError):
+        auth.create_canonical_query_string([(1, 1)])
+
+
+def test_create_canonical_query_string_sorted_pairs(expected_query_string):
+    query_string = auth.create_canonical_query_string([
+        ("response-content-encoding", "utf-8"),
+        ("response-content-type", "application/json"),
+    ])
+    assert query_string == expected_query_string
+
+
 def test_canonicalize_request(canonical_request, expected_canonical_request):
-    assert canonical_request == expected_canonical_request
+    assert canonical_request == expected_canonical_request.encode("ascii")
 
 
 def test_string_to_sign(
@@ -151,42 +198,60 @@ def test_string_to_sign(
     string_to_sign, _ = auth.create_string_to_sign(
         canonical_request,
         request_params["region"],
-        request_datetime,
+        request_datetime.strftime(auth.DATE_FMT),
+        request_datetime.strftime(auth.ISO8601_FMT),
     )
-    assert string_to_sign == expected_string_to_sign
+    assert string_to_sign == expected_string_to_sign.encode("ascii")
 
 
 def test_signing_key(
-    secret_key,
+    aws4_secret,
     expected_signing_key,
     request_datetime,
     request_params,
 ):
     signing_key = auth.create_signing_key(
-        request_datetime,
-        secret_key,
+        request_datetime.strftime(auth.DATE_FMT),
+        aws4_secret,
         request_params["region"],
     )
     assert signing_key == expected_signing_key
 
 
+def test_batch_sign(expected_signing_key):
+    strings_to_sign = ["first", b"second"]
+    expected = [
+        hmac.new(
+            expected_signing_key,
+            b"first",
+            hashlib.sha256,
+        ).hexdigest(),
+        hmac.new(
+            expected_signing_key,
+            b"second",
+            hashlib.sha256,
+        ).hexdigest(),
+    ]
+    assert auth.batch_sign(expected_signing_key, strings_to_sign) == expected
+
+
 def test_compute_auth_header(
     request_datetime,
     request_params,
     access_key,
-    secret_key,
+    aws4_secret,
     expected_auth_header,
 ):
     auth_header = auth.compute_auth_header(
         request_params["headers"],
         request_params["method"],
-        request_datetime,
+        request_datetime.strftime(auth.ISO8601_FMT),
         request_params["region"],
         request_params["bucket"],
         request_params["path"],
         request_params["query_string"],
         request_params["headers"]["x-amz-content-sha256"],
         access_key,
-        secret_key,
+        aws4_secret,
     )
     assert auth_header == expected_auth_header
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-import datetime
+import io
 import logging
+import time
 import mock
 
 import pytest
@@ -14,36 +15,45 @@ TEST_REGION_NAME = 'region'
 TEST_USEAST_REGION_NAME = 'us-east-1'
 
 
-@pytest.yield_fixture
+@pytest.fixture
 def mocked_client():
     client = S3Client("fake_key", "fake_secret")
     with mock.patch.object(client, "_make_request", autospec=True):
         yield client
 
 
-@pytest.yield_fixture
+@pytest.fixture
 def mock_fetch():
     with mock.patch("fido.fetch", autospec=True) as mock_fetch:
         yield mock_fetch
 
 
-@pytest.yield_fixture
-def mock_datetime():
-    # Hack to get around mock not being able to patch built-ins
-    time_now = datetime.datetime.fromtimestamp(100000)
+@pytest.fixture
+def mock_gmtime():
+    time_now = time.gmtime(100000)
     with mock.patch(
-        "twisted_s3.client.datetime.datetime",
-        new=mock.Mock(wraps=datetime.datetime),
-    ) as mock_datetime:
-        mock_datetime.utcnow.return_value = time_now
-        yield mock_datetime
+        "twisted_s3.client.time.gmtime",
+        autospec=True,
+        return_value=time_now,
+    ) as mock_gmtime:
+        yield mock_gmtime
 
 
-@pytest.yield_fixture
+@pytest.fixture
 def client():
     yield S3Client("fake_key", "fake_secret")
 
 
+@pytest.fixture
+def fixed_client():
+    yield S3Client(
+        "fake_key",
+        "fake_secret",
+        region=TEST_REGION_NAME,
+        bucket=TEST_BUCKET_NAME,
+    )
+
+
 def test_get(mocked_client):
     mocked_client.get(
         "/path/001.gz",
@@ -124,12 +134,33 @@ def test_put(mocked_client):
     )
 
 
+def test_put_stream(mocked_client):
+    payload = b"some bytes"
+    mocked_client.put_stream(
+        "/path/001.gz",
+        io.BytesIO(payload),
+        headers="headers",
+        region="region",
+        bucket="bucket",
+    )
+    mocked_client._make_request.assert_called_once_with(
+        method="PUT",
+        path="/path/001.gz",
+        headers="headers",
+        query_params=None,
+        payload=payload,
+        region="region",
+        bucket="bucket",
+        hashed_payload=auth.compute_hashed_payload(payload),
+    )
+
+
 def test_make_request_missing_bucket(client):
     with pytest.raises(ValueError):
         client._make_request("GET", "/path/001.gz", None, None, b"")
 
 
-def test_make_request(client, mock_fetch, mock_datetime):
+def test_make_request(client, mock_fetch, mock_gmtime):
     client._make_request(
         method="GET",
         path="path/001.gz",
@@ -145,7 +176,7 @@ def test_make_request(client, mock_fetch, mock_datetime):
     # Check that the URL is correct
     host = twisted_s3.client.HOST_TEMPLATE\
         .format(bucket=TEST_BUCKET_NAME, region=TEST_REGION_NAME)
-    assert args[0] == "http://" + host + "/path/001.gz?start-at=abc"
+    assert args[0] == "https://" + host + "/path/001.gz?start-at=abc"
     assert len(args) == 1
 
     # Check that the headers are correct
@@ -157,7 +188,7 @@ def test_make_request(client, mock_fetch, mock_datetime):
 
     assert headers == {
         "host": host,
-        "x-amz-date": mock_datetime.utcnow().strftime(auth.ISO8601_FMT),
+        "x-amz-date": "%04d%02d%02dT%02d%02d%02dZ" % mock_gmtime()[:6],
         "header": "blah",
     }
 
@@ -165,7 +196,7 @@ def test_make_request(client, mock_fetch, mock_datetime):
     assert kwargs == {"method": "GET", "body": b""}
 
 
-def test_make_request_client(client, mock_fetch, mock_datetime):
+def test_make_request_client(client, mock_fetch, mock_gmtime):
     client._make_request(
         method="GET",
         path="path/001.gz",
@@ -181,10 +212,105 @@ def test_make_request_client(client, mock_fetch, mock_datetime):
     # Check that the URL is correct
     host = twisted_s3.client.US_EAST_TEMPLATE\
         .format(bucket=TEST_BUCKET_NAME, region=TEST_USEAST_REGION_NAME)
-    assert args[0] == "http://" + host + "/path/001.gz?start-at=abc"
+    assert args[0] == "https://" + host + "/path/001.gz?start-at=abc"
     assert len(args) == 1
 
 
+def test_fixed_client_matches_generic_path(
+    client,
+    fixed_client,
+    mock_fetch,
+    mock_gmtime,
+):
+    # The specialized closure built for a fixed region/bucket must
+    # produce exactly the same request as the generic path.
+    fixed_client._make_request(
+        method="PUT",
+        path="path/001.gz",
+        headers={"header": "blah"},
+        query_params={"start-at": "abc"},
+        payload=b"some bytes",
+    )
+    fixed_call = mock_fetch.call_args
+    mock_fetch.reset_mock()
+
+    client._make_request(
+        method="PUT",
+        path="path/001.gz",
+        headers={"header": "blah"},
+        query_params={"start-at": "abc"},
+        payload=b"some bytes",
+        region=TEST_REGION_NAME,
+        bucket=TEST_BUCKET_NAME,
+    )
+    assert mock_fetch.call_args == fixed_call
+
+
+def test_fixed_client_call_time_override(
+    fixed_client,
+    mock_fetch,
+    mock_gmtime,
+):
+    # Overriding region/bucket at call time falls back to the generic
+    # path, which builds the host from the overrides.
+    fixed_client._make_request(
+        method="GET",
+        path="path/001.gz",
+        headers=None,
+        query_params=None,
+        payload=b"",
+        region="other-region",
+        bucket="other-bucket",
+    )
+    args, _ = mock_fetch.call_args
+    host = twisted_s3.client.HOST_TEMPLATE\
+        .format(bucket="other-bucket", region="other-region")
+    assert args[0] == "https://" + host + "/path/001.gz"
+
+
+def test_fixed_client_fallback_validates(fixed_client):
+    # The generic fallback keeps its region/bucket validation: if the
+    # client-level region is gone, an override that only supplies a
+    # bucket can't resolve one.
+    fixed_client.region = None
+    with pytest.raises(ValueError):
+        fixed_client._make_request(
+            method="GET",
+            path="path/001.gz",
+            headers=None,
+            query_params=None,
+            payload=b"",
+            bucket="other-bucket",
+        )
+
+
+def test_make_request_does_not_mutate_caller_dicts(
+    client,
+    mock_fetch,
+    mock_gmtime,
+):
+    headers = {"header": "blah"}
+    query_params = {"start-at": "abc"}
+    client._make_request(
+        method="GET",
+        path="path/001.gz",
+        headers=headers,
+        query_params=query_params,
+        payload=b"",
+        region=TEST_REGION_NAME,
+        bucket=TEST_BUCKET_NAME,
+    )
+    # The auth headers must not leak into dicts the caller may reuse
+    assert headers == {"header": "blah"}
+    assert query_params == {"start-at": "abc"}
+
+
+def test_list_does_not_mutate_caller_query_params(mocked_client):
+    query_params = {"start-after": "abc"}
+    mocked_client.list(query_params=query_params)
+    assert query_params == {"start-after": "abc"}
+
+
 def test_no_noisy_logging(capsys):
     # Ensures that even if basic logging in set up, we don't see noisy
     # twisted log lines
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
 import mock
 
 import pytest
 from crochet import EventualResult
 from fido import Response
+from twisted.internet import defer
 
 from twisted_s3.future import Future
 from twisted_s3.future import S3ResponseError
@@ -20,6 +23,15 @@ def get_mock_eventual(code=200):
     return mock_eventual
 
 
+def get_fired_eventual(result):
+    # A real EventualResult around an already-fired deferred. The fake
+    # reactor runs callFromThread inline since there's no reactor thread
+    # in these tests.
+    mock_reactor = mock.Mock()
+    mock_reactor.callFromThread.side_effect = lambda f: f()
+    return EventualResult(defer.succeed(result), mock_reactor)
+
+
 def test_result():
     mock_eventual = get_mock_eventual()
     f = Future(mock_eventual, S3Response)
@@ -33,3 +45,59 @@ def test_result_error():
     f = Future(mock_eventual, S3Response)
     with pytest.raises(S3ResponseError):
         f.result(timeout=1.0)
+
+
+def test_result_async():
+    mock_eventual = get_mock_eventual()
+    f = Future(mock_eventual, S3Response)
+    response = asyncio.run(f.result_async(timeout=1.0))
+    assert isinstance(response, S3Response)
+    mock_eventual.wait.assert_called_once_with(1.0)
+
+
+def test_result_async_error():
+    mock_eventual = get_mock_eventual(403)
+    f = Future(mock_eventual, S3Response)
+    with pytest.raises(S3ResponseError):
+        asyncio.run(f.result_async(timeout=1.0))
+
+
+def test_await():
+    result = mock.Mock(spec=Response, code=200, body=b"body")
+    f = Future(get_fired_eventual(result), S3Response)
+
+    async def run():
+        return await f
+
+    response = asyncio.run(run())
+    assert isinstance(response, S3Response)
+    assert response.body == b"body"
+
+
+def test_await_failure():
+    # A transport-level error arrives as a twisted Failure and must be
+    # re-raised as its original exception.
+    mock_reactor = mock.Mock()
+    mock_reactor.callFromThread.side_effect = lambda f: f()
+    eventual = EventualResult(
+        defer.fail(ConnectionError("boom")),
+        mock_reactor,
+    )
+    f = Future(eventual, S3Response)
+
+    async def run():
+        return await f
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(run())
+
+
+def test_await_error():
+    result = mock.Mock(spec=Response, code=403, body=b"denied")
+    f = Future(get_fired_eventual(result), S3Response)
+
+    async def run():
+        return await f
+
+    with pytest.raises(S3ResponseError):
+        asyncio.run(run())
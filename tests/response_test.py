@@ -4,7 +4,9 @@ import mock
 import pytest
 from fido import Response
 
+from twisted_s3 import response as response_module
 from twisted_s3.response import ListResponse
+from twisted_s3.response import S3Response
 
 
 @pytest.fixture(scope="module")
@@ -19,6 +21,21 @@ def truncated_list_response_xml():
         return xml_file.read()
 
 
+@pytest.fixture(params=["lxml", "etree"])
+def parser(request, monkeypatch):
+    """Run ListResponse tests against both parser implementations.
+
+    The ElementTree fallback is what users without the lxml extra get,
+    so it has to stay correct even when lxml is installed in the test
+    environment.
+    """
+    if request.param == "etree":
+        monkeypatch.setattr("twisted_s3.response._lxml_etree", None)
+    elif response_module._lxml_etree is None:
+        pytest.skip("lxml is not installed")
+    return request.param
+
+
 def mock_response(response_xml):
     response = mock.Mock(
         spec=Response,
@@ -28,7 +45,7 @@ def mock_response(response_xml):
     return response
 
 
-def test_list_response(list_response_xml):
+def test_list_response(list_response_xml, parser):
     response = mock_response(list_response_xml)
     list_response = ListResponse(response)
     assert list_response.code == 200
@@ -39,7 +56,7 @@ def test_list_response(list_response_xml):
     assert list_response.continuation_token is None
 
 
-def test_list_response_truncated(truncated_list_response_xml):
+def test_list_response_truncated(truncated_list_response_xml, parser):
     response = mock_response(truncated_list_response_xml)
     list_response = ListResponse(response)
     assert list_response.code == 200
@@ -48,3 +65,50 @@ def test_list_response_truncated(truncated_list_response_xml):
     assert list_response.common_prefixes == ["path/test/", "path/test2/"]
     assert list_response.is_truncated
     assert list_response.continuation_token == "fake-token-omgggg"
+
+
+def test_bodyview():
+    response = mock_response(b"some bytes")
+    s3_response = S3Response(response)
+    assert bytes(s3_response.bodyview) == b"some bytes"
+
+
+def test_lxml_parse_tree_stays_bounded(monkeypatch):
+    lxml_etree = pytest.importorskip("lxml.etree")
+    num_keys = 1000
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        "<Name>my-bucket</Name>"
+        "<Prefix>path/</Prefix>"
+        "<NextContinuationToken>fake-token</NextContinuationToken>"
+        "<IsTruncated>true</IsTruncated>"
+        + "".join(
+            "<Contents><Key>path/{i:04d}</Key><Size>3</Size></Contents>"
+            .format(i=i)
+            for i in range(num_keys)
+        )
+        + "</ListBucketResult>"
+    )
+
+    # Spy on iterparse so the parser's root element can be inspected
+    # after the parse: completed subtrees must not accumulate under it.
+    contexts = []
+
+    class SpyEtree(object):
+        @staticmethod
+        def iterparse(*args, **kwargs):
+            context = lxml_etree.iterparse(*args, **kwargs)
+            contexts.append(context)
+            return context
+
+    monkeypatch.setattr("twisted_s3.response._lxml_etree", SpyEtree)
+
+    list_response = ListResponse(mock_response(body))
+    assert list_response.keys == [
+        "path/{i:04d}".format(i=i) for i in range(num_keys)
+    ]
+    assert list_response.is_truncated
+    assert list_response.continuation_token == "fake-token"
+    assert len(contexts) == 1
+    assert len(contexts[0].root) < 5
@@ -11,27 +11,108 @@ The basic algorithm is:
        on request.
 
 """
+import functools
 import hashlib
 import hmac
-import six
-if six.PY3:
-    from urllib.parse import quote  # pragma: no cover
-    from urllib.parse import quote_plus  # pragma: no cover
-else:
-    from urllib import quote  # pragma: no cover
-    from urllib import quote_plus  # pragma: no cover
+from urllib.parse import quote
+from urllib.parse import urlencode
 
 
 ISO8601_FMT = "%Y%m%dT%H%M%SZ"
 DATE_FMT = "%Y%m%d"
 
+_sha256 = hashlib.sha256
+
+# ASCII-only lowercasing table; str.translate with it is a C loop,
+# cheaper than a Python-level .lower() call per header name.
+_LOWER_TBL = dict(
+    (c, c + 32) for c in range(ord("A"), ord("Z") + 1)
+)
+
+# SHA-256 of the empty string. GET/LIST requests all carry an empty
+# payload, so the hash is a well-known constant for them.
+EMPTY_PAYLOAD_SHA256 = (
+    "e3b0c44298fc1c149afbf4c8996fb924"
+    "27ae41e4649b934ca495991b7852b855"
+)
+
 
 def compute_hashed_payload(payload):
-    return hashlib.sha256(payload).hexdigest()
+    """Hex-encoded SHA-256 of the request payload.
+
+    `payload` is either bytes or a seekable binary file-like object.
+    File-like payloads are hashed in a streaming fashion (via
+    hashlib.file_digest where available, which also releases the GIL on
+    large buffers) and the file position is restored afterwards.
+    """
+    if isinstance(payload, bytes):
+        if not payload:
+            return EMPTY_PAYLOAD_SHA256
+        # One shot: hashlib performs no slicing and already releases
+        # the GIL for large buffers, so chunking bytes by hand would
+        # only add Python-loop overhead.
+        return _sha256(payload).hexdigest()
+
+    position = payload.tell()
+    if hasattr(hashlib, "file_digest"):
+        digest = hashlib.file_digest(payload, "sha256")
+    else:
+        digest = _sha256()
+        for chunk in iter(lambda: payload.read(256 * 1024), b""):
+            digest.update(chunk)
+    payload.seek(position)
+    return digest.hexdigest()
+
+
+def _hmac_sha256(key, msg):
+    # hmac.digest is a C one-shot that reuses an internal OpenSSL
+    # context, avoiding an HMAC object allocation per call.
+    return hmac.digest(key, msg, "sha256")
+
+
+def _encode(s):
+    # Canonical requests are almost always pure ASCII; encoding as
+    # ascii skips the UTF-8 multi-byte state machine.
+    return s.encode("ascii" if s.isascii() else "utf-8")
 
 
 def sign(key, msg):
-    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+    return _hmac_sha256(key, msg.encode("utf-8"))
+
+
+def batch_sign(signing_key, strings_to_sign):
+    """Sign many strings to sign that share one signing key.
+
+    The inner HMAC state for the key is absorbed once into a base
+    context; each message then only pays for a context copy plus its
+    own data, which roughly halves the HMAC cost for fan-out workloads
+    (bulk get/list) where every request shares the day's signing key.
+
+    :param signing_key: key bytes returned by create_signing_key
+    :param strings_to_sign: iterable of str or bytes, as produced by
+        create_string_to_sign
+    :returns: list of hex-encoded signatures, in input order
+    """
+    base = hmac.new(signing_key, digestmod=_sha256)
+    signatures = []
+    for string_to_sign in strings_to_sign:
+        if not isinstance(string_to_sign, bytes):
+            string_to_sign = _encode(string_to_sign)
+        ctx = base.copy()
+        ctx.update(string_to_sign)
+        signatures.append(ctx.hexdigest())
+    return signatures
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_path(path):
+    """Percent-encode an object path for the canonical URI.
+
+    "~" is unreserved per RFC 3986 and must not be escaped in SigV4
+    canonical URIs. Results are cached since workloads like list
+    pagination re-sign the same paths repeatedly.
+    """
+    return quote(path, safe="/~")
 
 
 def create_canonical_query_string(query_params):
@@ -39,17 +120,24 @@ def create_canonical_query_string(query_params):
     by key name. E.g. {"mimeType": "application/json", "limit": 20} will yield
     a query_string of "limit=20&mimeType=application%2Fjson"
 
-    :param query_params: dict of query params
-    :type query_params: dict with str keys
+    :param query_params: dict of query params, or a sequence of
+        (key, value) pairs already in canonical (sorted-by-key) order,
+        which skips the sort here
+    :type query_params: dict with str keys, or sequence of pairs
     """
-    string_params = []
-    for key in sorted(query_params.keys()):
-        if not isinstance(key, six.string_types):
+    if not query_params:
+        return ""
+    if isinstance(query_params, dict):
+        if not all(isinstance(key, str) for key in query_params):
             raise ValueError("Query param keys must be strings")
-        string_params.append(
-            quote_plus(key) + "=" + quote_plus(query_params[key])
-        )
-    return "&".join(string_params)
+        items = sorted(query_params.items())
+    else:
+        items = query_params
+        if not all(isinstance(key, str) for key, _ in items):
+            raise ValueError("Query param keys must be strings")
+    # quote (not quote_plus): SigV4 canonicalization requires spaces to
+    # be percent-encoded as %20, never "+".
+    return urlencode(items, quote_via=quote, safe="")
 
 
 def create_canonical_headers(headers, bucket, region):
@@ -70,19 +158,28 @@ def create_canonical_headers(headers, bucket, region):
     - any additional headers *can* be included. We will include them, as AWS
       docs claim this adds increased security.
     """
-    headers = dict(
-        (name.lower(), value.strip())
-        for name, value in six.iteritems(headers)
-    )
-
-    sorted_headers = sorted(six.iteritems(headers))
+    if all(name.islower() for name in headers):
+        # Fast path: the headers the client generates (host, x-amz-date,
+        # x-amz-content-sha256) are already lowercase, so skip rebuilding
+        # the dict and sort the items directly.
+        sorted_headers = sorted(
+            (name, value.strip())
+            for name, value in headers.items()
+        )
+    else:
+        lowered = dict(
+            (name.translate(_LOWER_TBL), value.strip())
+            for name, value in headers.items()
+        )
+        sorted_headers = sorted(lowered.items())
     signed_headers = ";".join(
         name for (name, value) in sorted_headers
     )
-    canonical_headers = "\n".join(
-        name + ":" + value for (name, value) in sorted_headers
-    )
-    canonical_headers += "\n"
+    # The trailing empty element makes join produce the required final
+    # "\n" without a full-string copy from += afterwards.
+    header_lines = [name + ":" + value for (name, value) in sorted_headers]
+    header_lines.append("")
+    canonical_headers = "\n".join(header_lines)
     return signed_headers, canonical_headers
 
 
@@ -107,8 +204,11 @@ def canonicalize_request(
 
     Note that this is simply a way of organizing and serializing the HTTP request
     for authorization purposes.
+
+    Returns the canonical request as bytes, ready for hashing, so the
+    whole request is only encoded once.
     """
-    canonical_uri = quote(path)
+    canonical_uri = _quote_path(path)
     signed_headers, canonical_headers = create_canonical_headers(
         headers,
         bucket,
@@ -123,10 +223,10 @@ def canonicalize_request(
         signed_headers,
         hashed_payload,
     ]
-    return "\n".join(elements), signed_headers
+    return _encode("\n".join(elements)), signed_headers
 
 
-def create_string_to_sign(canonical_request, region, dt):
+def create_string_to_sign(canonical_request, region, date_str, iso_str):
     """The string to sign is a string in a specific format:
     "AWS4-HMAC-SHA256" + "\n" +
     ISO-8601 timestamp + "\n" +
@@ -134,9 +234,16 @@ def create_string_to_sign(canonical_request, region, dt):
     Hex(SHA256Hash(CanonicalRequest))
 
     Scope is date + "/" + region + "/" + service + "/" + "aws4_request"
+
+    `canonical_request` is the encoded bytes returned by
+    canonicalize_request. `date_str` and `iso_str` are the request date
+    formatted with DATE_FMT and ISO8601_FMT respectively; they're passed
+    in pre-formatted so the datetime is only formatted once per request.
+
+    Returns the string to sign as bytes, ready for the signature HMAC.
     """
     scope_elements = [
-        dt.strftime(DATE_FMT),
+        date_str,
         region,
         "s3",
         "aws4_request",
@@ -144,16 +251,25 @@ def create_string_to_sign(canonical_request, region, dt):
     scope = "/".join(scope_elements)
     string_elements = [
         "AWS4-HMAC-SHA256",
-        dt.strftime(ISO8601_FMT),
+        iso_str,
         scope,
-        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        _sha256(canonical_request).hexdigest(),
     ]
     string_to_sign = "\n".join(string_elements)
-    return string_to_sign, scope
+    return _encode(string_to_sign), scope
 
 
-def create_signing_key(now, secret_key, region):
-    date_key = sign(("AWS4" + secret_key).encode("utf-8"), now.strftime("%Y%m%d"))
+@functools.lru_cache(maxsize=32)
+def create_signing_key(date_str, aws4_secret, region):
+    """Derive the signing key for a given (date, secret key, region).
+
+    `aws4_secret` is the b"AWS4" + secret key bytes; S3Client precomputes
+    it once at construction so no per-request concatenation or encode is
+    needed. The derivation chains four HMAC-SHA256 calls, but its inputs
+    only change once per day for a given client, so the result is
+    memoized.
+    """
+    date_key = sign(aws4_secret, date_str)
     region_key = sign(date_key, region)
     service_key = sign(region_key, "s3")
     return sign(service_key, "aws4_request")
@@ -174,14 +290,15 @@ def format_auth_header(access_key, scope, signed_headers, signature):
 def compute_auth_header(
     headers,
     method,
-    dt,
+    amz_date,
     region,
     bucket,
     path,
     canonical_query_string,
     hashed_payload,
     access_key,
-    secret_key,
+    aws4_secret,
+    date_stamp=None,
 ):
     # Format HTTP request for signing
     canonical_request, signed_headers = canonicalize_request(
@@ -193,14 +310,20 @@ def compute_auth_header(
         canonical_query_string,
         hashed_payload,
     )
-    string_to_sign, scope = create_string_to_sign(canonical_request, region, dt)
+    # `amz_date` is the ISO8601_FMT-formatted request time, as sent in
+    # the x-amz-date header; its first eight characters are the DATE_FMT
+    # date. Callers that already have the DATE_FMT date on hand (the
+    # client formats both from one gmtime call) pass it as `date_stamp`.
+    date_str = date_stamp if date_stamp is not None else amz_date[:8]
+    string_to_sign, scope = create_string_to_sign(
+        canonical_request,
+        region,
+        date_str,
+        amz_date,
+    )
     # Sign request
-    signing_key = create_signing_key(dt, secret_key, region)
-    signature = hmac.new(
-        signing_key,
-        string_to_sign.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    signing_key = create_signing_key(date_str, aws4_secret, region)
+    signature = _hmac_sha256(signing_key, string_to_sign).hex()
     # Format Authorization header
     return format_auth_header(
         access_key,
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
-import datetime
+import functools
+import hashlib
 import logging
+import sys
+import time
 
 import fido
 
@@ -12,12 +15,57 @@ from twisted_s3.future import Future
 US_EAST_TEMPLATE = "{bucket}.s3.amazonaws.com"
 HOST_TEMPLATE = "{bucket}.s3-{region}.amazonaws.com"
 
+# Interned header/query-param names set on every request. Hyphenated
+# literals aren't auto-interned like identifiers, so interning them lets
+# dict inserts hit the identity fast path instead of re-hashing.
+_H_HOST = sys.intern("host")
+_H_CONTENT_SHA256 = sys.intern("x-amz-content-sha256")
+_H_DATE = sys.intern("x-amz-date")
+_H_AUTHORIZATION = sys.intern("Authorization")
+_Q_LIST_TYPE = sys.intern("list-type")
+_Q_PREFIX = sys.intern("prefix")
+_Q_CONTINUATION_TOKEN = sys.intern("continuation-token")
+_Q_MAX_KEYS = sys.intern("max-keys")
+_Q_DELIMITER = sys.intern("delimiter")
+
 # Turn down default logging in twisted. Ideally this would be fixed upstream,
 # but that ticket has been open for 7 years:
 # http://twistedmatrix.com/trac/ticket/4021
 logging.getLogger('twisted').setLevel(logging.CRITICAL)
 
 
+def _read_and_hash(payload_file, chunk_size=256 * 1024):
+    """Read a binary file fully while hashing it, in a single pass.
+
+    Returns (payload_bytes, hex_sha256). The body has to end up as one
+    bytes object anyway because fido only accepts bytes bodies, but
+    reading and hashing chunk-by-chunk means the file is only traversed
+    once and the hash state is warm by the time the read finishes.
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    for chunk in iter(lambda: payload_file.read(chunk_size), b""):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+def _fast_amz_date(now_tuple):
+    """ISO8601_FMT timestamp from a time.gmtime tuple.
+
+    Direct %-formatting of the integer fields; no strftime, no locale or
+    format-string parsing.
+    """
+    return "%04d%02d%02dT%02d%02d%02dZ" % now_tuple[:6]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_host(bucket, region):
+    """Format (and cache) the S3 host for a bucket/region pair."""
+    template = US_EAST_TEMPLATE if region == "us-east-1" else HOST_TEMPLATE
+    return template.format(bucket=bucket, region=region)
+
+
 class S3Client(object):
 
     def __init__(
@@ -25,7 +73,7 @@ class S3Client(object):
         region=None, bucket=None,
     ):
         """An asynchronous s3 client based on the fido HTTP utility,
-        which is based on twisted/crochet.
+        which is based on twisted/crochet. Requests are made over HTTPS.
 
         :param access_key: AWS access key ID
         :type access_key: str
@@ -38,16 +86,62 @@ class S3Client(object):
         """
         self.access_key = access_key
         self.secret_key = secret_key
+        # Precompute the b"AWS4" + secret bytes used to seed signing-key
+        # derivation; it never changes for the client's lifetime.
+        self._aws4_secret = ("AWS4" + secret_key).encode("utf-8")
         self.region = region
         self.bucket = bucket
+        # With both region and bucket fixed at the client level the host
+        # and URL prefix are fixed too; precompute them so the common
+        # fixed-bucket workload skips per-request string construction.
+        if region and bucket:
+            self._default_host = _format_host(bucket, region)
+            self._default_url_prefix = "https://" + self._default_host
+            # Partially evaluate _make_request: with region and bucket
+            # fixed, the validation branch and host lookup disappear
+            # from the per-request path.
+            self._make_request = self._build_fixed_make_request(
+                region,
+                bucket,
+            )
+        else:
+            self._default_host = None
+            self._default_url_prefix = None
+
+    def _build_fixed_make_request(self, fixed_region, fixed_bucket):
+        """Build a _make_request specialized for a fixed region/bucket.
+
+        The host and URL prefix are captured as free variables; calls
+        that override region or bucket fall back to the generic path.
+        """
+        host = self._default_host
+        url_prefix = self._default_url_prefix
+        generic = self._make_request
+        execute = self._execute
+
+        def _make_request_fixed(
+            method, path, headers, query_params, payload,
+            region=None, bucket=None, hashed_payload=None,
+        ):
+            if region or bucket:
+                return generic(
+                    method, path, headers, query_params, payload,
+                    region=region, bucket=bucket,
+                    hashed_payload=hashed_payload,
+                )
+            return execute(
+                method, path, headers, query_params, payload,
+                fixed_region, fixed_bucket, host, url_prefix,
+                hashed_payload,
+            )
+
+        return _make_request_fixed
 
     def _make_request(
         self, method, path, headers, query_params, payload,
-        region=None, bucket=None,
+        region=None, bucket=None, hashed_payload=None,
     ):
-        """Authenticate and actually make the HTTP request to S3."""
-        headers = headers or {}
-        query_params = query_params or {}
+        """Resolve region/bucket, then make the HTTP request to S3."""
         region = region or self.region
         bucket = bucket or self.bucket
 
@@ -61,38 +155,60 @@ class S3Client(object):
                 ),
             )
 
-        hashed_payload = auth.compute_hashed_payload(payload)
+        host = _format_host(bucket, region)
+        return self._execute(
+            method, path, headers, query_params, payload,
+            region, bucket, host, "https://" + host, hashed_payload,
+        )
+
+    def _execute(
+        self, method, path, headers, query_params, payload,
+        region, bucket, host, url_prefix, hashed_payload,
+    ):
+        """Authenticate and actually make the HTTP request to S3."""
+        # Copy the caller's dict so the auth headers added below never
+        # leak back into a dict the caller may reuse across requests.
+        headers = {} if headers is None else dict(headers)
+        query_params = query_params or {}
 
-        host_template = US_EAST_TEMPLATE if region == "us-east-1"\
-            else HOST_TEMPLATE
-        host = host_template.format(bucket=bucket, region=region)
+        if hashed_payload is None:
+            # GET/LIST bodies are empty; skip the call entirely for them.
+            if not payload:
+                hashed_payload = auth.EMPTY_PAYLOAD_SHA256
+            else:
+                hashed_payload = auth.compute_hashed_payload(payload)
 
         query_string = auth.create_canonical_query_string(query_params)
         if not path.startswith("/"):
             path = "/" + path
 
-        now = datetime.datetime.utcnow()
+        # time.gmtime + %-formatting beats datetime.utcnow().strftime for
+        # a fixed format: no datetime object, no format-string parsing.
+        now = time.gmtime()
+        amz_date = _fast_amz_date(now)
+        date_stamp = "%04d%02d%02d" % now[:3]
 
         # Add headers necessary for auth computation
-        headers["host"] = host
-        headers["x-amz-content-sha256"] = hashed_payload
-        headers["x-amz-date"] = now.strftime(auth.ISO8601_FMT)
-        headers["Authorization"] = auth.compute_auth_header(
+        headers[_H_HOST] = host
+        headers[_H_CONTENT_SHA256] = hashed_payload
+        headers[_H_DATE] = amz_date
+        headers[_H_AUTHORIZATION] = auth.compute_auth_header(
             headers,
             method,
-            now,
+            amz_date,
             region,
             bucket,
             path,
             query_string,
             hashed_payload,
             self.access_key,
-            self.secret_key,
+            self._aws4_secret,
+            date_stamp=date_stamp,
         )
 
-        url = "http://{host}{path}".format(host=host, path=path)
+        url = url_prefix + path
         if query_string:
-            url += "?" + query_string
+            url = url + "?" + query_string
         return fido.fetch(url, method=method, body=payload, headers=headers)
 
     def get(
@@ -150,16 +266,16 @@ class S3Client(object):
         delimiter,
         continuation_token,
     ):
-        query_params["list-type"] = "2"
+        query_params[_Q_LIST_TYPE] = "2"
 
         if prefix is not None:
-            query_params["prefix"] = prefix
+            query_params[_Q_PREFIX] = prefix
         if continuation_token is not None:
-            query_params["continuation-token"] = continuation_token
+            query_params[_Q_CONTINUATION_TOKEN] = continuation_token
         if limit is not None:
-            query_params["max-keys"] = str(limit)
+            query_params[_Q_MAX_KEYS] = str(limit)
         if delimiter is not None:
-            query_params["delimiter"] = delimiter
+            query_params[_Q_DELIMITER] = delimiter
 
     def list(
         self,
@@ -207,7 +323,9 @@ class S3Client(object):
 
         :rtype: Future, returning ListResponse.
         """
-        query_params = query_params or {}
+        # Copy before merging in the list params so the caller's dict
+        # isn't mutated.
+        query_params = dict(query_params) if query_params else {}
         S3Client._add_query_params_for_list(
             query_params,
             prefix,
@@ -269,3 +387,49 @@ class S3Client(object):
             ),
             response_class=response.S3Response,
         )
+
+    def put_stream(
+        self,
+        path,
+        payload_file,
+        headers=None,
+        region=None,
+        bucket=None,
+    ):
+        """Set S3 object at path to the contents of a file. Like put,
+        except the file is read and hashed in one chunked pass, so a
+        large upload isn't traversed twice and hashing overlaps the
+        read. The body itself is still buffered fully in memory: fido
+        only accepts bytes bodies, so a true streaming upload (a twisted
+        IBodyProducer with STREAMING-AWS4-HMAC-SHA256-PAYLOAD chunked
+        signing) isn't reachable through its API.
+
+        :param path: Object path, e.g. "/logs/2016/file.gz"
+        :type path: str
+        :param payload_file: Seekable binary file-like object containing
+            the object payload.
+        :param headers: Additional headers to send in S3 HTTP request. Note
+            that the headers "x-amz-date" and "Authorization" will be added as
+            part of the authentication process.
+        :type headers: dict, with str keys and str values
+        :param region: S3 region in which the object resides. E.g. "us-west-2".
+        :type region: str
+        :param bucket: Name of S3 bucket
+        :type bucket: str
+
+        :rtype: Future, returning S3Response.
+        """
+        payload, hashed_payload = _read_and_hash(payload_file)
+        return Future(
+            self._make_request(
+                method="PUT",
+                path=path,
+                headers=headers,
+                query_params=None,
+                payload=payload,
+                region=region,
+                bucket=bucket,
+                hashed_payload=hashed_payload,
+            ),
+            response_class=response.S3Response,
+        )
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
+from twisted.python.failure import Failure
 
 
 class S3ResponseError(Exception):
@@ -17,10 +20,25 @@ class Future(object):
     future = S3Client.get(...)
     response = future.result(2)
     """
+
+    __slots__ = ("eventual", "response_class")
+
     def __init__(self, eventual, response_class):
         self.eventual = eventual
         self.response_class = response_class
 
+    def _wrap(self, result):
+        """Turn a raw HTTP result into a response object, or raise."""
+        if result.code >= 300:
+            raise S3ResponseError(
+                "S3 returned status code: {code} with body: {body}".format(
+                    code=result.code,
+                    body=result.body,
+                ),
+            )
+        else:
+            return self.response_class(result)
+
     def result(self, timeout=None):
         """Block for `timeout` seconds on the results of the S3 HTTP call.
 
@@ -31,13 +49,63 @@ class Future(object):
         :raises S3ResponseError: if the HTTP call is not successful, e.g. a
         403 response is received.
         """
-        result = self.eventual.wait(timeout)
-        if result.code >= 300:
-            raise S3ResponseError(
-                "S3 returned status code: {code} with body: {body}".format(
-                    code=result.code,
-                    body=result.body,
-                ),
-            )
-        else:
-            return self.response_class(result)
+        return self._wrap(self.eventual.wait(timeout))
+
+    def __await__(self):
+        """Make the future directly awaitable: `response = await future`.
+
+        Unlike result_async(), this doesn't tie up an executor thread
+        per in-flight request; the underlying deferred hands its result
+        straight to the caller's event loop, so concurrency scales with
+        round-trip time rather than with thread-pool size.
+
+        :raises S3ResponseError: if the HTTP call is not successful, e.g. a
+        403 response is received.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        eventual = self.eventual
+
+        def deliver(result):
+            # Runs on the caller's event loop.
+            if fut.cancelled():  # pragma: no cover
+                return
+            if isinstance(result, Failure):
+                fut.set_exception(result.value)
+            else:
+                fut.set_result(result)
+
+        def bridge(passthrough):
+            # Runs in the reactor thread, after EventualResult has
+            # already stored the fired value; hand that value over to
+            # the event loop thread-safely.
+            eventual._result_retrieved = True
+            loop.call_soon_threadsafe(deliver, eventual._value)
+            return passthrough
+
+        # Deferreds aren't thread-safe, so attach the callback from the
+        # reactor thread.
+        eventual._reactor.callFromThread(
+            lambda: eventual._deferred.addBoth(bridge),
+        )
+        result = yield from fut.__await__()
+        return self._wrap(result)
+
+    async def result_async(self, timeout=None):
+        """Asynchronous counterpart to result(), for asyncio callers.
+
+        crochet runs the twisted reactor in a dedicated thread and only
+        exposes a blocking wait on the eventual result, so the wait is
+        handed to the event loop's default executor; many futures can
+        then be awaited concurrently without serializing their waits on
+        the caller's loop.
+
+        :param timeout: time to wait for results of the HTTP call.
+        :type timeout: float or int
+        :raises crochet.TimeoutError: if the result is not ready before
+        `timeout` is hit.
+        :raises S3ResponseError: if the HTTP call is not successful, e.g. a
+        403 response is received.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.result, timeout)
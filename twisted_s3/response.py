@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
-import re
+from io import BytesIO
 from xml.etree import ElementTree
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover
+    _lxml_etree = None
+
+# Fully-qualified child tag names per XML namespace. The S3 namespace is
+# stable across responses, so the "{ns}Tag" strings are built once here
+# instead of being re-concatenated for every parsed element.
+_TAG_CACHE = {}
+
 
 class S3Response(object):
     """An object representing an HTTP response from S3. This is for simple
@@ -12,6 +22,9 @@ class S3Response(object):
     ._response. This will be a `fido.Response` object. You can use this to
     access the response's headers.
     """
+
+    __slots__ = ("_response",)
+
     def __init__(self, response):
         self._response = response
 
@@ -25,6 +38,15 @@ class S3Response(object):
         """HTTP response body"""
         return self._response.body
 
+    @property
+    def bodyview(self):
+        """Zero-copy memoryview of the response body.
+
+        Callers that hash, slice, or write out large bodies can use this
+        to avoid allocating another bytes copy of the payload.
+        """
+        return memoryview(self._response.body)
+
 
 class ListResponse(S3Response):
     """An object representing parsed XML returned by List Objects v2 endpoint.
@@ -36,31 +58,129 @@ class ListResponse(S3Response):
     print(response.keys)  # list of strings
     """
 
-    # S3's XML responses are namespaced, such that the XML tags always begin
-    # with, e.g. "{http://s3.amazonaws.com/doc/2006-03-01/}". Instead of
-    # hardcoding these tags, we'll use a regex to extract them, future-proofing
-    # against them changing the tag.
-    NS_PATTERN = re.compile(r"\{http.*?\}")
+    __slots__ = (
+        "_root",
+        "_namespace",
+        "_is_truncated",
+        "_continuation_token",
+        "_keys",
+        "_common_prefixes",
+    )
 
     def __init__(self, response):
         super(ListResponse, self).__init__(response)
 
+        if _lxml_etree is not None:
+            self._parse_with_lxml(response.body)
+            return
+
         self._root = ElementTree.fromstring(response.body)
         self._namespace = ListResponse._get_namespace(self._root)
+        self._parse_root(self._root, self._namespace)
 
-        self._is_truncated = ListResponse._get_is_truncated(
-            self._root,
-            self._namespace,
+    def _parse_root(self, root, namespace):
+        """Extract all fields in a single walk over the root's children,
+        rather than one namespace-qualified findall per property.
+
+        This covers the pagination metadata too: is_truncated and
+        continuation_token fall out of the same walk that collects keys,
+        so there's no separate tree traversal to defer for callers that
+        only read .keys.
+        """
+        tags = _TAG_CACHE.get(namespace)
+        if tags is None:
+            tags = _TAG_CACHE[namespace] = {
+                "Key": namespace + "Key",
+                "Prefix": namespace + "Prefix",
+            }
+        key_tag = tags["Key"]
+        prefix_tag = tags["Prefix"]
+
+        ns_len = len(namespace)
+        keys = []
+        common_prefixes = []
+        is_truncated = False
+        continuation_token = None
+
+        for child in root:
+            local = child.tag[ns_len:]
+            if local == "Contents":
+                keys.append(child.find(key_tag).text)
+            elif local == "CommonPrefixes":
+                common_prefixes.append(child.find(prefix_tag).text)
+            elif local == "IsTruncated":
+                is_truncated = child.text == "true"
+            elif local == "NextContinuationToken":
+                continuation_token = child.text
+
+        self._keys = keys
+        self._common_prefixes = common_prefixes
+        self._is_truncated = is_truncated
+        self._continuation_token = (
+            continuation_token if is_truncated else None
         )
-        self._continuation_token = None
-        if self._is_truncated:
-            self._continuation_token = ListResponse._get_continuation_token(
-                self._root,
-                self._namespace,
-            )
 
-        self._keys = None
-        self._common_prefixes = None
+    def _parse_with_lxml(self, body):
+        """Extract all fields in one streaming pass with lxml's C parser.
+
+        iterparse only materializes the elements we care about and each
+        one is cleared as soon as its text is read, so a 1000-key list
+        response never holds the full DOM in memory.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        keys = []
+        common_prefixes = []
+        is_truncated = False
+        continuation_token = None
+
+        events = _lxml_etree.iterparse(
+            BytesIO(body),
+            events=("end",),
+            tag=(
+                "{*}Contents",
+                "{*}CommonPrefixes",
+                "{*}Key",
+                "{*}Prefix",
+                "{*}IsTruncated",
+                "{*}NextContinuationToken",
+            ),
+        )
+        for _, element in events:
+            tag = element.tag
+            if tag.endswith("}Key"):
+                # Fires before the enclosing <Contents> completes; the
+                # container's own end event does the cleanup.
+                keys.append(element.text)
+                continue
+            if tag.endswith("}Prefix"):
+                # The response echoes the requested prefix in a top-level
+                # <Prefix>; only <CommonPrefixes><Prefix> entries count.
+                if element.getparent().tag.endswith("}CommonPrefixes"):
+                    common_prefixes.append(element.text)
+                    continue
+            elif tag.endswith("}IsTruncated"):
+                is_truncated = element.text == "true"
+            elif tag.endswith("}NextContinuationToken"):
+                continuation_token = element.text
+            # Everything reaching here -- the <Contents> and
+            # <CommonPrefixes> containers and the top-level scalar tags
+            # -- is a direct child of the root. Clear each one as it
+            # completes and drop its already-consumed earlier siblings,
+            # so the tree stays bounded no matter how many keys the
+            # page holds.
+            element.clear()
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+
+        self._keys = keys
+        self._common_prefixes = common_prefixes
+        self._is_truncated = is_truncated
+        self._continuation_token = (
+            continuation_token if is_truncated else None
+        )
 
     @property
     def is_truncated(self):
@@ -90,13 +210,6 @@ class ListResponse(S3Response):
         up under common_prefixes. For more information see the common_prefixes
         docstring.
         """
-        if self._keys is None:
-            self._keys = [
-                element.text for element in
-                self._root.findall(
-                    "{ns}Contents/{ns}Key".format(ns=self._namespace)
-                )
-            ]
         return self._keys
 
     @property
@@ -121,29 +234,13 @@ class ListResponse(S3Response):
             print(r.keys)  # prints ["a/b/1", "a/b/2", "a/3", "a/4"]
             print(r.common_prefixes)  # prints []
         """
-        if self._common_prefixes is None:
-            self._common_prefixes = [
-                element.text for element in
-                self._root.findall(
-                    "{ns}CommonPrefixes/{ns}Prefix".format(ns=self._namespace)
-                )
-            ]
         return self._common_prefixes
 
-    @classmethod
-    def _get_namespace(cls, element):
-        match = cls.NS_PATTERN.match(element.tag)
-        return match.group()
-
-    @staticmethod
-    def _get_is_truncated(root, namespace):
-        # The relevant XML tag looks like <IsTruncated>false</IsTruncated>
-        return root.find(
-            "{ns}IsTruncated".format(ns=namespace)
-        ).text == "true"
-
     @staticmethod
-    def _get_continuation_token(root, namespace):
-        return root.find(
-            "{ns}NextContinuationToken".format(ns=namespace)
-        ).text
+    def _get_namespace(element):
+        # S3's XML responses are namespaced, such that the XML tags always
+        # begin with, e.g. "{http://s3.amazonaws.com/doc/2006-03-01/}".
+        # The namespace is always a "{...}" prefix at position 0, so a
+        # plain index beats invoking the regex engine.
+        tag = element.tag
+        return tag[:tag.index("}") + 1]